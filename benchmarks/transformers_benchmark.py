@@ -0,0 +1,182 @@
+"""
+Microbenchmark of the page-to-DataFrame transformation, comparing the former per-item
+row builders (`page_rows`) with the column buffers (`ColumnBuffer`) on synthetic pages.
+
+Run it from the project root:
+
+    python -m benchmarks.transformers_benchmark --pages 2000
+"""
+# Standard Imports
+import argparse
+import time
+from functools import partial
+from typing import Any, Callable, Dict, List
+
+# 3rd party packages
+import pandas as pd
+
+# Custom modules
+from src.transformers import ColumnBuffer
+
+PAGE_SIZE: int = 50
+
+
+def _artists(i: int) -> List[Dict[str, Any]]:
+    return [{'name': f'Artist {i}'}, {'name': f'Artist {i + 1}'}]
+
+
+def _track(i: int) -> Dict[str, Any]:
+    return {
+        'id': f'track{i}',
+        'name': f'Track {i}',
+        'popularity': i % 100,
+        'duration_ms': 180000 + i,
+        'album': {'name': f'Album {i // 10}'},
+        'artists': _artists(i)
+    }
+
+
+def _album_item(i: int) -> Dict[str, Any]:
+    return {
+        'album': {
+            'name': f'Album {i}',
+            'artists': _artists(i),
+            'release_date': '2020-01-01',
+            'popularity': i % 100,
+            'images': [{'url': f'https://i.scdn.co/image/{i}'}]
+        }
+    }
+
+
+def _playlist_item(i: int) -> Dict[str, Any]:
+    return {'name': f'Playlist {i}', 'id': f'playlist{i}'}
+
+
+def _playlist_track_item(i: int) -> Dict[str, Any]:
+    # Removed tracks are returned as None
+    return {'track': _track(i) if i % 25 else None}
+
+
+ITEM_BUILDERS: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    'albums': _album_item,
+    'playlists': _playlist_item,
+    'playlist_tracks': _playlist_track_item
+}
+
+
+def make_pages(kind: str, pages: int) -> List[Dict[str, Any]]:
+    """
+    Builds synthetic raw API pages of the given kind.
+    """
+    make_item: Callable[[int], Dict[str, Any]] = ITEM_BUILDERS[kind]
+    return [
+        {'items': [make_item(p * PAGE_SIZE + i) for i in range(PAGE_SIZE)]}
+        for p in range(pages)
+    ]
+
+
+def album_row(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Former album row builder of `DataFetcher.fetch_all_albums`.
+    """
+    album: Dict[str, Any] = item['album']
+    return {
+        'Album Name': album['name'],
+        'Artists': ", ".join(artist['name'] for artist in album['artists']),
+        'Release Date': album['release_date'],
+        'Popularity': album['popularity'],
+        'Image URL': album['images'][0]['url']
+    }
+
+
+def playlist_row(playlist: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Former playlist row builder of `DataFetcher.fetch_all_playlists`.
+    """
+    return {
+        'Playlist Name': playlist['name'],
+        'Playlist ID': playlist['id']
+    }
+
+
+def track_row(track: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Former track row builder, `DataFetcher._get_track_info`.
+    """
+    return {
+        'Track ID':track['id'],
+        'Track Name': track['name'],
+        'Track Popularity': track['popularity'],
+        'Track Duration': track['duration_ms'],
+        'Track Album Name': track['album']['name'],
+        'Track Artists': ", ".join(artist['name'] for artist in track['artists'])
+    }
+
+
+def page_rows(kind: str, page: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Former per-item rows of a page of the given kind.
+    """
+    if kind == 'albums':
+        return [album_row(item) for item in page['items']]
+    if kind == 'playlists':
+        return [playlist_row(playlist) for playlist in page['items']]
+    return [track_row(item['track']) for item in page['items'] if item['track'] is not None]
+
+
+def rows_to_frame(kind: str, pages: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Former transformation: a dict per item, then a DataFrame from the list of dicts.
+    """
+    rows: List[Dict[str, Any]] = []
+    for page in pages:
+        rows.extend(page_rows(kind, page))
+    return pd.DataFrame(rows)
+
+
+def columns_to_frame(kind: str, pages: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Current transformation: per-column buffers, then a DataFrame from the columns.
+    """
+    buffer: ColumnBuffer = ColumnBuffer(kind)
+    for page in pages:
+        buffer.extend_page(page)
+    return buffer.to_frame()
+
+
+def _best_time(func: Callable[[], pd.DataFrame], repeat: int) -> float:
+    best: float = float('inf')
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """
+    Runs the benchmark for each kind of page and prints rows/sec.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pages', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for kind in ITEM_BUILDERS:
+        pages: List[Dict[str, Any]] = make_pages(kind, args.pages)
+        n_rows: int = len(rows_to_frame(kind, pages))
+        # Both transformations must give identical outputs, including without any item
+        pd.testing.assert_frame_equal(rows_to_frame(kind, pages), columns_to_frame(kind, pages))
+        pd.testing.assert_frame_equal(rows_to_frame(kind, []), columns_to_frame(kind, []))
+        before: float = _best_time(partial(rows_to_frame, kind, pages), args.repeat)
+        after: float = _best_time(partial(columns_to_frame, kind, pages), args.repeat)
+        print(
+            f"{kind}: {n_rows} rows - "
+            f"rows: {n_rows / before:,.0f} rows/sec, "
+            f"columns: {n_rows / after:,.0f} rows/sec "
+            f"({before / after:.2f}x)"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,8 @@
 # Standard Imports
 import os
+import sys
+from enum import Enum
+from typing import Optional
 
 # Third-party
 from dotenv import load_dotenv
@@ -7,6 +10,7 @@ import typer
 from rich import print
 
 # Custom modules
+from src.archive import transform_archive
 from src.data_fetcher import DataFetcher
 from src.spotify_wrapper import SpotifyClient
 
@@ -16,10 +20,21 @@ app = typer.Typer(
     help="A custom Spotify Command Line Interface"
 )
 
+class IdType(str, Enum):
+    """Types of IDs accepted by the hydrate command"""
+    TRACKS = 'tracks'
+    ALBUMS = 'albums'
+
 @app.command()
-def fetch_albums(output_path: str = './all_albums.csv', pagination_limit: int = 50):
+def fetch_albums(
+    output_path: str = './all_albums.csv',
+    pagination_limit: int = 50,
+    archive_path: Optional[str] = None
+):
     """
     Fetch all saved albums for the current user and save them to a CSV file.
+
+    Optionally archive the raw API pages, see the transform command.
     """
     # Load variables from .env file
     load_dotenv()
@@ -43,13 +58,20 @@ def fetch_albums(output_path: str = './all_albums.csv', pagination_limit: int =
         # Get all data
         data_fetcher.fetch_all_albums(
             csv_filepath=output_path,
-            pagination_limit=pagination_limit
+            pagination_limit=pagination_limit,
+            archive_filepath=archive_path
         )
 
 @app.command()
-def fetch_playlists(output_path: str = './all_playlists.csv', pagination_limit: int = 50):
+def fetch_playlists(
+    output_path: str = './all_playlists.csv',
+    pagination_limit: int = 50,
+    archive_path: Optional[str] = None
+):
     """
     Fetch all saved playlists for the current user and save them to a CSV file.
+
+    Optionally archive the raw API pages, see the transform command.
     """
     # Load variables from .env file
     load_dotenv()
@@ -73,13 +95,21 @@ def fetch_playlists(output_path: str = './all_playlists.csv', pagination_limit:
         # Get all data
         data_fetcher.fetch_all_playlists(
             csv_filepath=output_path,
-            pagination_limit=pagination_limit
+            pagination_limit=pagination_limit,
+            archive_filepath=archive_path
         )
 
 @app.command()
-def fetch_playlist_tracks(playlist_id: str, output_path: str, pagination_limit: int = 50):
+def fetch_playlist_tracks(
+    playlist_id: str,
+    output_path: str,
+    pagination_limit: int = 50,
+    archive_path: Optional[str] = None
+):
     """
     Fetch all tracks from a chosen playlist and save them to a CSV file.
+
+    Optionally archive the raw API pages, see the transform command.
     """
     # Load variables from .env file
     load_dotenv()
@@ -103,8 +133,75 @@ def fetch_playlist_tracks(playlist_id: str, output_path: str, pagination_limit:
         data_fetcher.fetch_tracks_from_playlist(
             playlist_id=playlist_id,
             csv_filepath=output_path,
-            pagination_limit=pagination_limit
+            pagination_limit=pagination_limit,
+            archive_filepath=archive_path
         )
 
+@app.command()
+def hydrate(id_type: IdType, output_path: str, ids_path: str = '-', workers: int = 8):
+    """
+    Resolve track or album IDs, one per line in a file or stdin ('-'), and save them
+    to a CSV file.
+
+    Reading IDs from stdin needs a cached Spotify token, e.g. from a previous run.
+    """
+    # Read IDs from a file before the OAuth flow, so that a wrong path fails fast
+    ids = None
+    if ids_path != '-':
+        try:
+            with open(ids_path, encoding='utf-8') as f:
+                ids = f.read().splitlines()
+        except OSError as e:
+            raise typer.BadParameter(str(e), param_hint="'--ids-path'") from e
+
+    # Load variables from .env file
+    load_dotenv()
+
+    # Get Spotify application's credentials
+    client_id=os.environ.get('CLIENT_ID')
+    client_secret=os.environ.get('CLIENT_SECRET')
+    redirect_uri=os.environ.get('REDIRECT_URI')
+    app_scope = os.environ.get('SCOPE')
+
+    # Instantiate Spotify Client using a Context Manager
+    with SpotifyClient(
+        client_id=client_id,
+        client_secret=client_secret,
+        redirect_uri=redirect_uri,
+        scope=app_scope
+    ) as client:
+        # The OAuth flow may prompt for the redirect URL on stdin, which holds the IDs
+        if ids is None:
+            if client.auth_manager.cache_handler.get_cached_token() is None:
+                raise typer.BadParameter(
+                    "reading IDs from stdin needs a cached Spotify token, "
+                    "run a command once to log in or pass a file",
+                    param_hint="'--ids-path'"
+                )
+            ids = sys.stdin.read().splitlines()
+
+        # Instantiate Data Fetcher
+        data_fetcher = DataFetcher(client)
+
+        data_fetcher.hydrate_ids(
+            ids=ids,
+            id_type=id_type.value,
+            csv_filepath=output_path,
+            workers=workers
+        )
+
+@app.command()
+def transform(archive_path: str, output_path: str, workers: Optional[int] = None):
+    """
+    Rebuild a CSV file from an archive of raw API pages, without any network access.
+
+    A .parquet output path writes a Parquet file instead.
+    """
+    transform_archive(
+        archive_filepath=archive_path,
+        output_filepath=output_path,
+        workers=workers
+    )
+
 if __name__ == '__main__':
     app()
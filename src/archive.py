@@ -0,0 +1,292 @@
+# Standard Imports
+import contextlib
+import gzip
+import importlib.util
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain
+from types import TracebackType
+from typing import IO, Any, ContextManager, Deque, Dict, Iterator, List, Optional, Type
+
+# 3rd party packages
+import pandas as pd
+
+# orjson is considerably faster than the standard library, use it when available
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Custom modules
+from .exceptions import (
+    ArchiveFormatError,
+    FileWriteError,
+    InvalidParameterError,
+    UnexpectedError
+)
+from .transformers import PAGE_COLUMNS, ColumnBuffer
+
+# Number of archived pages handed to a worker process at once
+CHUNK_SIZE: int = 64
+# Number of chunks in flight per worker process, bounds the memory of the parent
+CHUNKS_PER_WORKER: int = 2
+
+
+def _dumps(record: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(line: bytes) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+class PageArchive:
+    """
+    Archives raw Spotify API pages as gzip compressed newline-delimited JSON.
+
+    Each line of the archive holds a single page along with its kind and offset, so
+    that the CSV exports can later be rebuilt with `transform_archive` without any
+    network access.
+
+    Attributes:
+        filepath : str
+            The file path of the archive.
+        kind : str
+            The kind of the archived pages, one of 'albums', 'playlists' or
+            'playlist_tracks'.
+
+    Examples:
+        Basic usage:
+
+        ```
+        with PageArchive('albums.jsonl.gz', kind='albums') as archive:
+            archive.write_page(sp.current_user_saved_albums(limit=50), offset=0)
+        ```
+    """
+
+    def __init__(self, filepath: str, kind: str):
+        """
+        Initializes the PageArchive.
+
+        Args:
+            filepath : str
+                The file path of the archive. An existing file is overwritten.
+            kind : str
+                The kind of the archived pages.
+
+        Raises:
+            ArchiveFormatError
+                If the kind of pages is unknown.
+        """
+        if kind not in PAGE_COLUMNS:
+            raise ArchiveFormatError(f"Unknown kind of archived pages: {kind}")
+        self.filepath: str = filepath
+        self.kind: str = kind
+        self._file: Optional[IO[bytes]] = None
+
+    def __enter__(self) -> 'PageArchive':
+        try:
+            self._file = gzip.open(self.filepath, 'wb')
+        except OSError as e:
+            raise FileWriteError(f"Unable to open the archive {self.filepath}: {e}") from e
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        exc_traceback: Optional[TracebackType]
+    ) -> bool:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        return False
+
+    def write_page(self, page: Dict[str, Any], offset: int) -> None:
+        """
+        Appends a raw API page to the archive.
+
+        Args:
+            page : Dict[str, Any]
+                A raw paging object as returned by the Spotify API.
+            offset : int
+                The offset the page was requested with.
+
+        Raises:
+            FileWriteError
+                If there's an error writing to the archive.
+        """
+        try:
+            self._file.write(_dumps({'kind': self.kind, 'offset': offset, 'page': page}))
+            self._file.write(b'\n')
+        except OSError as e:
+            raise FileWriteError(f"Unable to write to the archive {self.filepath}: {e}") from e
+
+
+def open_archive(filepath: Optional[str], kind: str) -> ContextManager[Optional[PageArchive]]:
+    """
+    Opens a PageArchive, or a no-op context yielding None when no file path is given.
+    """
+    if filepath is None:
+        return contextlib.nullcontext()
+    return PageArchive(filepath, kind)
+
+
+def _transform_chunk(lines: List[bytes], kind: str) -> Dict[str, List[Any]]:
+    """
+    Worker function turning archived lines of a given kind into CSV columns.
+    """
+    buffer: ColumnBuffer = ColumnBuffer(kind)
+    for line in lines:
+        record: Dict[str, Any] = _loads(line)
+        if record['kind'] != kind:
+            raise ArchiveFormatError("Archive holds pages of more than one kind")
+        buffer.extend_page(record['page'])
+    return buffer.columns
+
+
+def _iter_chunks(archive_file: IO[bytes]) -> Iterator[List[bytes]]:
+    """
+    Lazily splits the lines of an open archive into chunks of CHUNK_SIZE pages.
+    """
+    chunk: List[bytes] = []
+    for line in archive_file:
+        if not line.strip():
+            continue
+        chunk.append(line)
+        if len(chunk) == CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _transform_chunks(archive_filepath: str, workers: int) -> ColumnBuffer:
+    """
+    Streams the chunks of an archive to the worker processes and gathers their columns.
+
+    At most CHUNKS_PER_WORKER chunks per worker are read ahead, so the archive is never
+    fully held in memory.
+
+    Raises:
+        ArchiveFormatError
+            If the archive holds no pages or pages of an unknown kind.
+    """
+    with gzip.open(archive_filepath, 'rb') as f:
+        chunks: Iterator[List[bytes]] = _iter_chunks(f)
+        first_chunk: Optional[List[bytes]] = next(chunks, None)
+        if first_chunk is None:
+            raise ArchiveFormatError(f"Archive {archive_filepath} holds no pages")
+        # The first page gives the kind, the workers check the others against it
+        kind: str = _loads(first_chunk[0])['kind']
+        if kind not in PAGE_COLUMNS:
+            raise ArchiveFormatError(f"Unknown kind of archived pages: {kind}")
+        buffer: ColumnBuffer = ColumnBuffer(kind)
+        chunks = chain([first_chunk], chunks)
+
+        if workers == 1:
+            for chunk in chunks:
+                buffer.extend_columns(_transform_chunk(chunk, kind))
+            return buffer
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Futures are gathered in submission order to keep the order of the pages
+            pending: Deque[Future] = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_transform_chunk, chunk, kind))
+                if len(pending) >= workers * CHUNKS_PER_WORKER:
+                    buffer.extend_columns(pending.popleft().result())
+            while pending:
+                buffer.extend_columns(pending.popleft().result())
+    return buffer
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    """
+    Returns the number of worker processes, defaulting to the number of CPUs.
+
+    Raises:
+        InvalidParameterError
+            If the number of worker processes is lower than 1.
+    """
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise InvalidParameterError(f"Number of workers must be at least 1, got {workers}")
+    return workers
+
+
+def transform_archive(
+        archive_filepath: str,
+        output_filepath: str,
+        workers: Optional[int] = None
+) -> None:
+    """
+    Rebuilds an export from a PageArchive without any network access.
+
+    The output format is picked from the extension of the output file: a Parquet file
+    is written for '.parquet' (requires pyarrow), a CSV file otherwise.
+
+    Args:
+        archive_filepath : str
+            The file path of the archive.
+        output_filepath : str
+            The file path where the export will be saved.
+        workers : int, optional
+            Number of worker processes, at least 1 (default is the number of CPUs).
+
+    Raises:
+        InvalidParameterError
+            If the number of worker processes is lower than 1, or if a Parquet file is
+            requested without pyarrow installed.
+        ArchiveFormatError
+            If the archive cannot be read or is malformed.
+        FileWriteError
+            If there's an error writing the export.
+        UnexpectedError
+            If an unexpected error occurs.
+
+    Examples:
+        Basic usage:
+
+        ```
+        transform_archive('albums.jsonl.gz', 'all_albums.csv')
+        ```
+    """
+    workers = _resolve_workers(workers)
+    # Fail before the transformation rather than when writing its result
+    if output_filepath.endswith('.parquet') and importlib.util.find_spec('pyarrow') is None:
+        raise InvalidParameterError(
+            "Writing a Parquet file requires the pyarrow package: pip install pyarrow"
+        )
+    try:
+        buffer: ColumnBuffer = _transform_chunks(archive_filepath, workers)
+    except ArchiveFormatError:
+        raise
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise ArchiveFormatError(f"Unable to read the archive {archive_filepath}: {e}") from e
+    except Exception as e:
+        raise UnexpectedError(
+            f"Unexpected error occured while transforming the archive: {e}"
+        ) from e
+
+    # Save dataframe into the chosen format
+    df: pd.DataFrame = buffer.to_frame()
+    try:
+        if output_filepath.endswith('.parquet'):
+            df.to_parquet(output_filepath, index=False)
+        else:
+            df.to_csv(output_filepath, index=False)
+        print(f"Archive dataFrame successfully saved in {output_filepath}.")
+    except IOError as e:
+        raise FileWriteError(f"Unable to write the archive export: {e}") from e
+    except Exception as e:
+        raise UnexpectedError(
+            f"An unexpected error occured while writing the archive export: {e}"
+        ) from e
@@ -1,15 +1,111 @@
 # 3rd party packages
-from typing import List, Dict, Any
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 import pandas as pd
 from tqdm import tqdm
 import spotipy
 
 # Custom modules
+from .archive import open_archive
 from .exceptions import (
+    AuthenticationError,
     SpotifyAPIError,
     FileWriteError,
+    InvalidParameterError,
     UnexpectedError
 )
+from .transformers import ColumnBuffer
+
+# Maximum number of IDs accepted per call by the Spotify "several items" endpoints
+SEVERAL_IDS_LIMITS: Dict[str, int] = {
+    'tracks': 50,
+    'albums': 20
+}
+
+# Spotify URIs, URLs and bare base62 IDs of tracks and albums
+SPOTIFY_URI_PATTERN: re.Pattern = re.compile(
+    r'^spotify:(?P<type>track|album):(?P<id>[0-9A-Za-z]{22})$'
+)
+SPOTIFY_URL_PATTERN: re.Pattern = re.compile(
+    r'^(?:https?://)?open\.spotify\.com/(?:intl-\w\w/)?'
+    r'(?P<type>track|album)/(?P<id>[0-9A-Za-z]{22})(?:\?.*)?$'
+)
+BASE62_ID_PATTERN: re.Pattern = re.compile(r'^[0-9A-Za-z]{22}$')
+
+
+def _check_hydrate_parameters(id_type: str, workers: int) -> None:
+    """
+    Checks the type of the IDs and the number of concurrent calls of `hydrate_ids`.
+
+    Raises:
+        InvalidParameterError
+            If the type of the IDs is not supported or the number of concurrent calls
+            is lower than 1.
+    """
+    if id_type not in SEVERAL_IDS_LIMITS:
+        raise InvalidParameterError(
+            f"Unsupported ID type {id_type}, expected one of {list(SEVERAL_IDS_LIMITS)}"
+        )
+    if workers < 1:
+        raise InvalidParameterError(f"Number of workers must be at least 1, got {workers}")
+
+
+def _normalize_id(raw_id: str, id_type: str) -> Optional[str]:
+    """
+    Turns a Spotify ID, URI or URL of the given type into a bare base62 ID.
+
+    Args:
+        raw_id : str
+            The Spotify ID, URI or URL.
+        id_type : str
+            The type of the ID, either 'tracks' or 'albums'.
+
+    Returns:
+        Optional[str]
+            The 22 characters base62 ID, or None if the entry is not a valid ID of
+            the given type.
+    """
+    raw_id = raw_id.strip()
+    match = SPOTIFY_URI_PATTERN.match(raw_id) or SPOTIFY_URL_PATTERN.match(raw_id)
+    if match is not None:
+        return match.group('id') if match.group('type') == id_type[:-1] else None
+    return raw_id if BASE62_ID_PATTERN.match(raw_id) else None
+
+
+def _normalize_ids(ids: Iterable[str], id_type: str) -> Tuple[List[str], int]:
+    """
+    Normalizes and deduplicates Spotify IDs, URIs or URLs, keeping the input order.
+
+    Args:
+        ids : Iterable[str]
+            The Spotify IDs, URIs or URLs. Blank entries are ignored.
+        id_type : str
+            The type of the IDs, either 'tracks' or 'albums'.
+
+    Returns:
+        Tuple[List[str], int]
+            The unique bare IDs and the number of invalid entries.
+    """
+    unique_ids: Dict[str, None] = {}
+    invalid: int = 0
+    for raw_id in ids:
+        if not raw_id.strip():
+            continue
+        spotify_id: Optional[str] = _normalize_id(raw_id, id_type)
+        if spotify_id is None:
+            invalid += 1
+        else:
+            unique_ids[spotify_id] = None
+    return list(unique_ids), invalid
+
+
+def _split_batches(ids: List[str], size: int) -> List[List[str]]:
+    """
+    Splits IDs into consecutive batches of at most size IDs.
+    """
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
 
 
 class DataFetcher:
@@ -122,7 +218,12 @@ class DataFetcher:
                 f"Unexpected error occured - calculate_total tracks: {e}"
             ) from e
 
-    def fetch_all_albums(self, csv_filepath: str, pagination_limit: int = 50) -> None:
+    def fetch_all_albums(
+            self,
+            csv_filepath: str,
+            pagination_limit: int = 50,
+            archive_filepath: Optional[str] = None
+    ) -> None:
         """
         Fetches all saved albums for the current user and saves them to a CSV file.
 
@@ -131,6 +232,9 @@ class DataFetcher:
                 The file path where the CSV file will be saved.
             pagination_limit : int, optional
                 Number of items to retrieve per API call (default is 50).
+            archive_filepath : str, optional
+                File path of a gzip archive where the raw API pages are also saved,
+                see `PageArchive` (default is None, no archive).
 
         Raises:
             SpotifyAPIError
@@ -156,9 +260,10 @@ class DataFetcher:
             ```
         """
         total_albums: int = self.calculate_total_albums()
-        albums: List[Dict[str, Any]] = []
+        albums: ColumnBuffer = ColumnBuffer('albums')
         offset: int = 0
-        with tqdm(total=total_albums, desc='Fetching all albums') as pbar:
+        with tqdm(total=total_albums, desc='Fetching all albums') as pbar, \
+                open_archive(archive_filepath, kind='albums') as archive:
             while True:
                 try:
                     results: Dict[str, Any] = self.sp.current_user_saved_albums(
@@ -167,29 +272,23 @@ class DataFetcher:
                     )
                     if not results['items']:
                         break
-                    for item in results['items']:
-                        album: Dict[str, Any] = item['album']
-                        albums.append(
-                            {
-                            'Album Name': album['name'],
-                            'Artists': ", ".join(artist['name'] for artist in album['artists']),
-                            'Release Date': album['release_date'],
-                            'Popularity': album['popularity'],
-                            'Image URL': album['images'][0]['url']
-                            }
-                        )
+                    if archive is not None:
+                        archive.write_page(results, offset=offset)
+                    albums.extend_items(results['items'])
                     # Update offset and progress bar
                     offset += pagination_limit
                     pbar.update(len(results['items']))
                 except spotipy.SpotifyException as e:
                     raise SpotifyAPIError(f"Failed to fetch albums - fetch_all_albums: {e}") from e
+                except FileWriteError:
+                    raise
                 except Exception as e:
                     raise UnexpectedError(
                         f"Unexpected error occured - fetch_all_albums: {e}"
                     ) from e
 
         # Save dataframe into a CSV
-        df: pd.DataFrame = pd.DataFrame(albums)
+        df: pd.DataFrame = albums.to_frame()
         try:
             df.to_csv(csv_filepath, index=False)
             print(f"All Albums dataFrame successfully saved in {csv_filepath}.")
@@ -198,7 +297,12 @@ class DataFetcher:
         except Exception as e:
             raise UnexpectedError(f"An unexpected error occured while writing the CSV: {e}") from e
 
-    def fetch_all_playlists(self, csv_filepath: str, pagination_limit: int = 50) -> None:
+    def fetch_all_playlists(
+            self,
+            csv_filepath: str,
+            pagination_limit: int = 50,
+            archive_filepath: Optional[str] = None
+    ) -> None:
         """
         Fetches all playlists for the current user and saves them to a CSV file.
 
@@ -207,6 +311,9 @@ class DataFetcher:
                 The file path where the CSV file will be saved.
             pagination_limit : int, optional
                 Number of items to retrieve per API call (default is 50).
+            archive_filepath : str, optional
+                File path of a gzip archive where the raw API pages are also saved,
+                see `PageArchive` (default is None, no archive).
 
         Raises:
             SpotifyAPIError
@@ -232,9 +339,10 @@ class DataFetcher:
             ```
         """
         total_playlists: int = self.calculate_total_playlists()
-        play_lists: List[Dict[str, Any]] = []
+        play_lists: ColumnBuffer = ColumnBuffer('playlists')
         offset: int = 0
-        with tqdm(total=total_playlists, desc='Fetching all playlists') as pbar:
+        with tqdm(total=total_playlists, desc='Fetching all playlists') as pbar, \
+                open_archive(archive_filepath, kind='playlists') as archive:
             # loop over all current user playlists
             while True:
                 try:
@@ -246,14 +354,9 @@ class DataFetcher:
                     # exit the loop if no playlists are found
                     if not playlists:
                         break
-                    # loop over playlists
-                    for playlist in playlists:
-                        play_lists.append(
-                            {
-                                'Playlist Name': playlist['name'],
-                                'Playlist ID': playlist['id']
-                            }
-                        )
+                    if archive is not None:
+                        archive.write_page(current_user_playlists, offset=offset)
+                    play_lists.extend_items(playlists)
 
                     # Update offset and progress bar
                     offset += pagination_limit
@@ -262,13 +365,15 @@ class DataFetcher:
                     raise SpotifyAPIError(
                         f"Failed to fetch all playlists - fetch_all_playlists: {e}"
                     ) from e
+                except FileWriteError:
+                    raise
                 except Exception as e:
                     raise UnexpectedError(
                         f"Unexpected error occured - fetch_all_playlists: {e}"
                     ) from e
 
             # Save dataframe into a CSV
-            df: pd.DataFrame = pd.DataFrame(play_lists)
+            df: pd.DataFrame = play_lists.to_frame()
             try:
                 df.to_csv(csv_filepath, index=False)
                 print(f"All Playlists dataFrame successfully saved in {csv_filepath}.")
@@ -283,7 +388,8 @@ class DataFetcher:
             self,
             playlist_id: str,
             csv_filepath: str,
-            pagination_limit: int = 50
+            pagination_limit: int = 50,
+            archive_filepath: Optional[str] = None
     ) -> None:
         """
         Fetches all tracks from a given playlist and saves them to a CSV file.
@@ -295,6 +401,9 @@ class DataFetcher:
                 The file path where the CSV file will be saved.
             pagination_limit : int, optional
                 Number of items to retrieve per API call (default is 50).
+            archive_filepath : str, optional
+                File path of a gzip archive where the raw API pages are also saved,
+                see `PageArchive` (default is None, no archive).
 
         Raises:
             SpotifyAPIError
@@ -325,9 +434,10 @@ class DataFetcher:
             ```
         """
         total_tracks: int = self.calculate_total_tracks(playlist_id=playlist_id)
-        tracks: List[Dict[str, Any]] = []
+        tracks: ColumnBuffer = ColumnBuffer('playlist_tracks')
         offset: int = 0
-        with tqdm(total=total_tracks, desc='Fetching all tracks from a playlist') as pbar:
+        with tqdm(total=total_tracks, desc='Fetching all tracks from a playlist') as pbar, \
+                open_archive(archive_filepath, kind='playlist_tracks') as archive:
             # loop over all current user playlists (update offset)
             while True:
                 try:
@@ -342,12 +452,10 @@ class DataFetcher:
                     # Exit if no playlist items exist
                     if len(playlist_items) == 0:
                         break
-                    # Process each track
-                    for item in playlist_items:
-                        # check if track exists
-                        if item['track'] is not None:
-                            track: Dict[str, Any] = item['track']
-                            tracks.append(self._get_track_info(track))
+                    if archive is not None:
+                        archive.write_page(playlist_tracks, offset=offset)
+                    # Process the tracks (items without a track are skipped)
+                    tracks.extend_items(playlist_items)
                     # Update progress and offset
                     offset+=pagination_limit
                     pbar.update(len(playlist_items))
@@ -355,13 +463,15 @@ class DataFetcher:
                     raise SpotifyAPIError(
                         f"Failed to fetch playlist tracks - fetch_tracks_from_playlist: {e}"
                     ) from e
+                except FileWriteError:
+                    raise
                 except Exception as e:
                     raise UnexpectedError(
                         f"Unexpected error while fetching playlist tracks: {e}"
                     ) from e
 
         # Save dataframe into a CSV
-        df: pd.DataFrame = pd.DataFrame(tracks)
+        df: pd.DataFrame = tracks.to_frame()
         try:
             df.to_csv(csv_filepath, index=False)
             print(f"All tracks dataFrame successfully saved in {csv_filepath}.")
@@ -372,15 +482,110 @@ class DataFetcher:
                 f"An unexpected error occured while writing all tracks to the CSV: {e}"
             ) from e
 
-    def _get_track_info(self, track: dict) -> dict:
+    def hydrate_ids(
+            self,
+            ids: Iterable[str],
+            id_type: str,
+            csv_filepath: str,
+            workers: int = 8
+    ) -> None:
+        """
+        Resolves track or album IDs through the batched Spotify endpoints and saves
+        them to a CSV file.
+
+        IDs are normalized to bare base62 IDs, deduplicated and sent
+        SEVERAL_IDS_LIMITS[id_type] per API call, with several calls in flight at once.
+        Tracks are saved with the columns of the playlist tracks export and albums with
+        the columns of the albums export. Entries that are not valid IDs of the given
+        type (e.g. a header row) and IDs unknown to Spotify are skipped and counted.
+
+        Args:
+            ids : Iterable[str]
+                The Spotify IDs, URIs or URLs to resolve. Blank entries are ignored.
+            id_type : str
+                The type of the IDs, either 'tracks' or 'albums'.
+            csv_filepath : str
+                The file path where the CSV file will be saved.
+            workers : int, optional
+                Number of concurrent API calls, at least 1 (default is 8).
+
+        Raises:
+            InvalidParameterError
+                If the type of the IDs is not supported or the number of concurrent
+                API calls is lower than 1.
+            AuthenticationError
+                If OAuth authentication fails.
+            SpotifyAPIError
+                If there's an error communicating with the Spotify API.
+            FileWriteError
+                If there's an error writing to the CSV file.
+            UnexpectedError
+                If an unexpected error occurs.
+
+        Examples:
+            Basic usage:
+
+            ```
+            fetcher = DataFetcher(sp)
+            fetcher.hydrate_ids(['4uLU6hMCjMI75M1A2tKUQC'], 'tracks', 'tracks.csv')
+            ```
+        """
+        _check_hydrate_parameters(id_type, workers)
+        # Only well-formed IDs reach the batches, spotipy rejects a whole batch otherwise
+        unique_ids, invalid = _normalize_ids(ids, id_type)
+        if invalid:
+            print(f"{invalid} {id_type} entries are not valid IDs and were skipped.")
+        batches: List[List[str]] = _split_batches(unique_ids, SEVERAL_IDS_LIMITS[id_type])
+        if id_type == 'tracks':
+            items: ColumnBuffer = ColumnBuffer('playlist_tracks')
+        else:
+            items = ColumnBuffer('albums')
+
+        with tqdm(total=len(unique_ids), desc=f'Hydrating {id_type}') as pbar, \
+                ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                # The first batch is fetched alone so that the OAuth flow, if any, runs
+                # once before the concurrent calls. map keeps the order of the batches.
+                results = chain(
+                    [self._fetch_several(id_type, batches[0])] if batches else [],
+                    executor.map(self._fetch_several, repeat(id_type), batches[1:])
+                )
+                for batch, objects in zip(batches, results):
+                    # Unknown IDs are returned as None and skipped by the buffers
+                    if id_type == 'tracks':
+                        items.extend_items([{'track': track} for track in objects])
+                    else:
+                        items.extend_items(
+                            [{'album': album} for album in objects if album is not None]
+                        )
+                    pbar.update(len(batch))
+            except spotipy.SpotifyOauthError as e:
+                raise AuthenticationError(f"OAuth authentication error: {e}") from e
+            except spotipy.SpotifyException as e:
+                raise SpotifyAPIError(f"Failed to hydrate {id_type} - hydrate_ids: {e}") from e
+            except Exception as e:
+                raise UnexpectedError(
+                    f"Unexpected error occured - hydrate_ids: {e}"
+                ) from e
+
+        if len(items) < len(unique_ids):
+            print(f"{len(unique_ids) - len(items)} {id_type} could not be found.")
+
+        # Save dataframe into a CSV
+        try:
+            items.to_frame().to_csv(csv_filepath, index=False)
+            print(f"Hydrated {id_type} dataFrame successfully saved in {csv_filepath}.")
+        except IOError as e:
+            raise FileWriteError(f"Unable to write hydrated {id_type} to the CSV file: {e}") from e
+        except Exception as e:
+            raise UnexpectedError(
+                f"An unexpected error occured while writing hydrated {id_type} to the CSV: {e}"
+            ) from e
+
+    def _fetch_several(self, id_type: str, ids: List[str]) -> List[Optional[Dict[str, Any]]]:
         """
-        Helper function to get the desired information from a track of a playlist
+        Helper function to fetch a batch of tracks or albums, None for unknown IDs
         """
-        return {
-            'Track ID':track['id'],
-            'Track Name': track['name'],
-            'Track Popularity': track['popularity'],
-            'Track Duration': track['duration_ms'],
-            'Track Album Name': track['album']['name'],
-            'Track Artists': ", ".join(artist['name'] for artist in track['artists'])
-        }
+        if id_type == 'tracks':
+            return self.sp.tracks(ids)['tracks']
+        return self.sp.albums(ids)['albums']
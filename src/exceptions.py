@@ -15,3 +15,6 @@ class FileWriteError(Exception):
 
 class UnexpectedError(Exception):
     """Raised for any unexpected errors"""
+
+class ArchiveFormatError(Exception):
+    """Raised when a raw response archive cannot be read or is malformed"""
@@ -0,0 +1,142 @@
+# Standard Imports
+from typing import Any, Callable, Dict, List
+
+# 3rd party packages
+import pandas as pd
+
+
+def _album_columns(items: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    albums: List[Dict[str, Any]] = [item['album'] for item in items]
+    return {
+        'Album Name': [album['name'] for album in albums],
+        'Artists': [
+            ", ".join([artist['name'] for artist in album['artists']]) for album in albums
+        ],
+        'Release Date': [album['release_date'] for album in albums],
+        'Popularity': [album['popularity'] for album in albums],
+        'Image URL': [album['images'][0]['url'] for album in albums]
+    }
+
+
+def _playlist_columns(items: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    return {
+        'Playlist Name': [playlist['name'] for playlist in items],
+        'Playlist ID': [playlist['id'] for playlist in items]
+    }
+
+
+def _track_columns(tracks: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    return {
+        'Track ID': [track['id'] for track in tracks],
+        'Track Name': [track['name'] for track in tracks],
+        'Track Popularity': [track['popularity'] for track in tracks],
+        'Track Duration': [track['duration_ms'] for track in tracks],
+        'Track Album Name': [track['album']['name'] for track in tracks],
+        'Track Artists': [
+            ", ".join([artist['name'] for artist in track['artists']]) for track in tracks
+        ]
+    }
+
+
+def _playlist_track_columns(items: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    # Playlist items may hold no track (e.g. removed or local files)
+    return _track_columns([item['track'] for item in items if item['track'] is not None])
+
+
+PAGE_COLUMNS: Dict[str, Callable[[List[Dict[str, Any]]], Dict[str, List[Any]]]] = {
+    'albums': _album_columns,
+    'playlists': _playlist_columns,
+    'playlist_tracks': _playlist_track_columns
+}
+
+
+class ColumnBuffer:
+    """
+    Accumulates API pages straight into per-column buffers.
+
+    Instead of building a dict per item and letting pandas re-infer every column from
+    a list of dicts, each page is split into one list per column which are then handed
+    to pandas as is.
+
+    Attributes:
+        kind : str
+            The kind of the buffered pages, one of the keys of `PAGE_COLUMNS`.
+        columns : Dict[str, List[Any]]
+            The column buffers, in the column order of the CSV export.
+
+    Examples:
+        Basic usage:
+
+        ```
+        buffer = ColumnBuffer('albums')
+        buffer.extend_page(sp.current_user_saved_albums(limit=50))
+        df = buffer.to_frame()
+        ```
+    """
+
+    def __init__(self, kind: str):
+        """
+        Initializes an empty ColumnBuffer.
+
+        Args:
+            kind : str
+                The kind of the buffered pages.
+
+        Raises:
+            KeyError
+                If the kind of pages is unknown.
+        """
+        self.kind: str = kind
+        self._page_columns: Callable[[List[Dict[str, Any]]], Dict[str, List[Any]]] = (
+            PAGE_COLUMNS[kind]
+        )
+        self.columns: Dict[str, List[Any]] = {
+            name: [] for name in self._page_columns([])
+        }
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values())))
+
+    def extend_page(self, page: Dict[str, Any]) -> None:
+        """
+        Appends the items of a raw API page to the column buffers.
+
+        Args:
+            page : Dict[str, Any]
+                A raw paging object as returned by the Spotify API.
+        """
+        self.extend_items(page['items'])
+
+    def extend_items(self, items: List[Dict[str, Any]]) -> None:
+        """
+        Appends a list of raw API items to the column buffers.
+
+        Args:
+            items : List[Dict[str, Any]]
+                The items of a raw paging object.
+        """
+        self.extend_columns(self._page_columns(items))
+
+    def extend_columns(self, columns: Dict[str, List[Any]]) -> None:
+        """
+        Appends already split columns, e.g. from another ColumnBuffer, to the buffers.
+
+        Args:
+            columns : Dict[str, List[Any]]
+                The columns to append, keyed by column name.
+        """
+        for name, values in columns.items():
+            self.columns[name].extend(values)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Builds a DataFrame from the column buffers.
+
+        Returns:
+            pd.DataFrame
+                The buffered rows, with the columns of the CSV export. An empty buffer
+                gives a DataFrame without columns, like the former list of rows did.
+        """
+        if len(self) == 0:
+            return pd.DataFrame()
+        return pd.DataFrame(self.columns)